@@ -13,63 +13,86 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from types import MappingProxyType
+
 from nautilus_trader.adapters.binance.common.enums import BinanceAccountType
 
 
-def get_http_base_url(account_type: BinanceAccountType, is_testnet: bool, is_us: bool) -> str:
-    # Testnet base URLs
-    if is_testnet:
-        if account_type.is_spot_or_margin:
-            return "https://testnet.binance.vision"
-        elif (
-            account_type == BinanceAccountType.USDT_FUTURE
-            or account_type == BinanceAccountType.COIN_FUTURE
-        ):
-            return "https://testnet.binancefuture.com"
-        else:
-            raise RuntimeError(  # pragma: no cover (design-time error)
-                f"invalid `BinanceAccountType`, was {account_type}",  # pragma: no cover
-            )
+def _build_http_base_urls() -> dict[tuple[BinanceAccountType, bool, bool], str]:
+    urls: dict[tuple[BinanceAccountType, bool, bool], str] = {}
+    for is_us in (False, True):
+        # Testnet base URLs (no separate Binance US testnet)
+        urls[(BinanceAccountType.SPOT, True, is_us)] = "https://testnet.binance.vision"
+        urls[(BinanceAccountType.MARGIN, True, is_us)] = "https://testnet.binance.vision"
+        urls[(BinanceAccountType.ISOLATED_MARGIN, True, is_us)] = "https://testnet.binance.vision"
+        urls[(BinanceAccountType.USDT_FUTURE, True, is_us)] = "https://testnet.binancefuture.com"
+        urls[(BinanceAccountType.COIN_FUTURE, True, is_us)] = "https://testnet.binancefuture.com"
+
+        # Live base URLs
+        top_level_domain: str = "us" if is_us else "com"
+        urls[(BinanceAccountType.SPOT, False, is_us)] = f"https://api.binance.{top_level_domain}"
+        urls[(BinanceAccountType.MARGIN, False, is_us)] = f"https://sapi.binance.{top_level_domain}"
+        urls[(BinanceAccountType.ISOLATED_MARGIN, False, is_us)] = (
+            f"https://sapi.binance.{top_level_domain}"
+        )
+        urls[(BinanceAccountType.USDT_FUTURE, False, is_us)] = (
+            f"https://fapi.binance.{top_level_domain}"
+        )
+        urls[(BinanceAccountType.COIN_FUTURE, False, is_us)] = (
+            f"https://dapi.binance.{top_level_domain}"
+        )
+    return urls
+
+
+def _build_ws_base_urls() -> dict[tuple[BinanceAccountType, bool, bool], str]:
+    urls: dict[tuple[BinanceAccountType, bool, bool], str] = {}
+    for is_us in (False, True):
+        # Testnet base URLs (no separate Binance US testnet, no COIN-M futures testnet)
+        urls[(BinanceAccountType.SPOT, True, is_us)] = "wss://testnet.binance.vision"
+        urls[(BinanceAccountType.MARGIN, True, is_us)] = "wss://testnet.binance.vision"
+        urls[(BinanceAccountType.ISOLATED_MARGIN, True, is_us)] = "wss://testnet.binance.vision"
+        urls[(BinanceAccountType.USDT_FUTURE, True, is_us)] = "wss://stream.binancefuture.com"
+
+        # Live base URLs
+        top_level_domain: str = "us" if is_us else "com"
+        urls[(BinanceAccountType.SPOT, False, is_us)] = (
+            f"wss://stream.binance.{top_level_domain}:9443"
+        )
+        urls[(BinanceAccountType.MARGIN, False, is_us)] = (
+            f"wss://stream.binance.{top_level_domain}:9443"
+        )
+        urls[(BinanceAccountType.ISOLATED_MARGIN, False, is_us)] = (
+            f"wss://stream.binance.{top_level_domain}:9443"
+        )
+        urls[(BinanceAccountType.USDT_FUTURE, False, is_us)] = (
+            f"wss://fstream.binance.{top_level_domain}"
+        )
+        urls[(BinanceAccountType.COIN_FUTURE, False, is_us)] = (
+            f"wss://dstream.binance.{top_level_domain}"
+        )
+    return urls
+
+
+# Base URLs keyed by (account_type, is_testnet, is_us), computed once at import
+_HTTP_BASE_URLS = MappingProxyType(_build_http_base_urls())
+_WS_BASE_URLS = MappingProxyType(_build_ws_base_urls())
+
 
-    # Live base URLs
-    top_level_domain: str = "us" if is_us else "com"
-    if account_type.is_spot:
-        return f"https://api.binance.{top_level_domain}"
-    elif account_type.is_margin:
-        return f"https://sapi.binance.{top_level_domain}"
-    elif account_type == BinanceAccountType.USDT_FUTURE:
-        return f"https://fapi.binance.{top_level_domain}"
-    elif account_type == BinanceAccountType.COIN_FUTURE:
-        return f"https://dapi.binance.{top_level_domain}"
-    else:
+def get_http_base_url(account_type: BinanceAccountType, is_testnet: bool, is_us: bool) -> str:
+    try:
+        return _HTTP_BASE_URLS[(account_type, is_testnet, is_us)]
+    except KeyError:
         raise RuntimeError(  # pragma: no cover (design-time error)
             f"invalid `BinanceAccountType`, was {account_type}",  # pragma: no cover
-        )
+        ) from None
 
 
 def get_ws_base_url(account_type: BinanceAccountType, is_testnet: bool, is_us: bool) -> str:
-    # Testnet base URLs
-    if is_testnet:
-        if account_type.is_spot_or_margin:
-            return "wss://testnet.binance.vision"
-        elif account_type == BinanceAccountType.USDT_FUTURE:
-            return "wss://stream.binancefuture.com"
-        elif account_type == BinanceAccountType.COIN_FUTURE:
-            raise ValueError("no testnet for COIN-M futures")
-        else:
-            raise RuntimeError(  # pragma: no cover (design-time error)
-                f"invalid `BinanceAccountType`, was {account_type}",  # pragma: no cover
-            )
-
-    # Live base URLs
-    top_level_domain: str = "us" if is_us else "com"
-    if account_type.is_spot_or_margin:
-        return f"wss://stream.binance.{top_level_domain}:9443"
-    elif account_type == BinanceAccountType.USDT_FUTURE:
-        return f"wss://fstream.binance.{top_level_domain}"
-    elif account_type == BinanceAccountType.COIN_FUTURE:
-        return f"wss://dstream.binance.{top_level_domain}"
-    else:
-        raise RuntimeError(
-            f"invalid `BinanceAccountType`, was {account_type}",
-        )  # pragma: no cover (design-time error)
+    try:
+        return _WS_BASE_URLS[(account_type, is_testnet, is_us)]
+    except KeyError:
+        if is_testnet and account_type == BinanceAccountType.COIN_FUTURE:
+            raise ValueError("no testnet for COIN-M futures") from None
+        raise RuntimeError(  # pragma: no cover (design-time error)
+            f"invalid `BinanceAccountType`, was {account_type}",  # pragma: no cover
+        ) from None
@@ -14,7 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import gc
 from collections.abc import Callable
+from collections.abc import Generator
+from contextlib import contextmanager
 from typing import TypeVar
 
 
@@ -67,3 +70,23 @@ def ensure_all_tasks_completed() -> None:
     except asyncio.CancelledError:
         # Expected due to task cancellation
         pass
+
+
+@contextmanager
+def gc_paused() -> Generator[None, None, None]:
+    """
+    Pause the cyclic garbage collector for the duration of the context.
+
+    Intended for building large, allocation heavy test fixtures (engines, caches,
+    portfolios) where generational collection passes add overhead without
+    freeing anything. The collector is re-enabled on exit only if it was
+    enabled on entry.
+
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
@@ -17,6 +17,7 @@ import datetime as dt
 import pathlib
 import random
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
 import fsspec
@@ -718,6 +719,12 @@ def get_contract_month_code(expiry_month: int) -> str:  # noqa: C901 (too comple
             raise ValueError(f"invalid `expiry_month`, was {expiry_month}. Use [1, 12].")
 
 
+@lru_cache(maxsize=8)
+def _load_csv_bars(uri: str) -> pd.DataFrame:
+    with fsspec.open(uri) as f:
+        return CSVBarDataLoader.load(file_path=f)
+
+
 class TestDataProvider:
     """
     Provides an API to load data from either the 'test/' directory or the projects
@@ -784,9 +791,10 @@ class TestDataProvider:
             return CSVTickDataLoader.load(file_path=f)
 
     def read_csv_bars(self, path: str) -> pd.DataFrame:
+        # Bar files are parsed once per process, a copy is returned as the
+        # wranglers may modify the frame in place (e.g. filling `volume`)
         uri = self._make_uri(path=path)
-        with fsspec.open(uri) as f:
-            return CSVBarDataLoader.load(file_path=f)
+        return _load_csv_bars(uri).copy()
 
     def read_parquet_ticks(self, path: str, timestamp_column: str = "timestamp") -> pd.DataFrame:
         uri = self._make_uri(path=path)
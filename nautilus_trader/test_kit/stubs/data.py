@@ -15,6 +15,7 @@
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from os import PathLike
 from typing import Any
 
@@ -110,8 +111,8 @@ class TestDataStubs:
         wrangler = QuoteTickDataWrangler(instrument=usdjpy)
         provider = TestDataProvider()
         ticks = wrangler.process_bar_data(
-            bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:2000],
-            ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")[:2000],
+            bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv").iloc[:2000],
+            ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv").iloc[:2000],
         )
         return ticks
 
@@ -210,6 +211,7 @@ class TestDataStubs:
         )
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def bar_3decimal() -> Bar:
         return Bar(
             bar_type=TestDataStubs.bartype_usdjpy_1min_bid(),
@@ -1,4 +1,4 @@
 #!/bin/bash
 
 poetry install --with test --all-extras
-poetry run pytest --ignore=tests/performance_tests --new-first --failed-first
+poetry run pytest --ignore=tests/performance_tests --new-first --failed-first -n logical --dist loadfile
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from collections.abc import Generator
+
 import pytest
 
 from nautilus_trader.common.component import init_logging
@@ -21,8 +23,10 @@ from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.instruments import CurrencyPair
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
+from nautilus_trader.test_kit.functions import gc_paused
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -35,11 +39,28 @@ def bypass_logging() -> None:
 
     """
     init_logging(
-        level_stdout=LogLevel.DEBUG,
+        level_stdout=LogLevel.ERROR,  # Set this to DEBUG to see all logging in tests
         bypass=True,  # Set this to False to see logging in tests
     )
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item: pytest.Item) -> Generator[None, None, None]:
+    """
+    Pause garbage collection while building fixtures for tests marked `gc_paused`.
+
+    Only opt in test classes whose setup builds many components (engines, clients,
+    portfolio), where collection cycles add cost without reclaiming anything.
+
+    """
+    if item.get_closest_marker("gc_paused") is None:
+        yield
+        return
+
+    with gc_paused():
+        yield
+
+
 @pytest.fixture(name="audusd_instrument")
 def fixture_audusd_instrument() -> CurrencyPair:
     return TestInstrumentProvider.default_fx_ccy("AUD/USD", Venue("SIM"))
@@ -57,3 +78,8 @@ def fixture_audusd_quote_ticks(
 ) -> list[QuoteTick]:
     wrangler = QuoteTickDataWrangler(instrument=audusd_instrument)
     return wrangler.process(data_provider.read_csv_ticks("truefx/audusd-ticks.csv"))
+
+
+@pytest.fixture(name="usdjpy_quote_ticks", scope="session")
+def fixture_usdjpy_quote_ticks() -> list[QuoteTick]:
+    return TestDataStubs.quote_ticks_usdjpy()
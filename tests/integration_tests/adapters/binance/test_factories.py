@@ -13,7 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import asyncio
+from collections.abc import Callable
 
 import pytest
 
@@ -28,221 +28,117 @@ from nautilus_trader.adapters.binance.futures.data import BinanceFuturesDataClie
 from nautilus_trader.adapters.binance.futures.execution import BinanceFuturesExecutionClient
 from nautilus_trader.adapters.binance.spot.data import BinanceSpotDataClient
 from nautilus_trader.adapters.binance.spot.execution import BinanceSpotExecutionClient
-from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import MessageBus
-from nautilus_trader.test_kit.mocks.cache_database import MockCacheDatabase
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
-class TestBinanceFactories:
-    def setup(self):
-        # Fixture Setup
-        self.loop = asyncio.get_event_loop()
-        self.clock = LiveClock()
-        self.trader_id = TestIdStubs.trader_id()
-        self.strategy_id = TestIdStubs.strategy_id()
-        self.account_id = TestIdStubs.account_id()
+SPOT_DATA_CONFIG = BinanceDataClientConfig(  # (S106 Possible hardcoded password)
+    api_key="SOME_BINANCE_API_KEY",  # Do not remove or will fail in CI
+    api_secret="SOME_BINANCE_API_SECRET",  # Do not remove or will fail in CI
+    account_type=BinanceAccountType.SPOT,
+)
+
+FUTURES_DATA_CONFIG = BinanceDataClientConfig(  # (S106 Possible hardcoded password)
+    api_key="SOME_BINANCE_API_KEY",  # Do not remove or will fail in CI
+    api_secret="SOME_BINANCE_API_SECRET",  # Do not remove or will fail in CI
+    account_type=BinanceAccountType.USDT_FUTURE,
+)
+
+SPOT_EXEC_CONFIG = BinanceExecClientConfig(  # (S106 Possible hardcoded password)
+    api_key="SOME_BINANCE_API_KEY",  # Do not remove or will fail in CI
+    api_secret="SOME_BINANCE_API_SECRET",  # Do not remove or will fail in CI
+    account_type=BinanceAccountType.SPOT,
+)
+
+FUTURES_EXEC_CONFIG = BinanceExecClientConfig(  # (S106 Possible hardcoded password)
+    api_key="SOME_BINANCE_API_KEY",  # Do not remove or will fail in CI
+    api_secret="SOME_BINANCE_API_SECRET",  # Do not remove or will fail in CI
+    account_type=BinanceAccountType.USDT_FUTURE,
+)
+
+
+HTTP_BASE_URL_CASES = [
+    (BinanceAccountType.SPOT, False, False, "https://api.binance.com"),
+    (BinanceAccountType.MARGIN, False, False, "https://sapi.binance.com"),
+    (BinanceAccountType.ISOLATED_MARGIN, False, False, "https://sapi.binance.com"),
+    (BinanceAccountType.USDT_FUTURE, False, False, "https://fapi.binance.com"),
+    (BinanceAccountType.COIN_FUTURE, False, False, "https://dapi.binance.com"),
+    (BinanceAccountType.SPOT, False, True, "https://api.binance.us"),
+    (BinanceAccountType.MARGIN, False, True, "https://sapi.binance.us"),
+    (BinanceAccountType.ISOLATED_MARGIN, False, True, "https://sapi.binance.us"),
+    (BinanceAccountType.USDT_FUTURE, False, True, "https://fapi.binance.us"),
+    (BinanceAccountType.COIN_FUTURE, False, True, "https://dapi.binance.us"),
+    (BinanceAccountType.SPOT, True, False, "https://testnet.binance.vision"),
+    (BinanceAccountType.MARGIN, True, False, "https://testnet.binance.vision"),
+    (BinanceAccountType.ISOLATED_MARGIN, True, False, "https://testnet.binance.vision"),
+    (BinanceAccountType.USDT_FUTURE, True, False, "https://testnet.binancefuture.com"),
+]
+
+WS_BASE_URL_CASES = [
+    (BinanceAccountType.SPOT, False, False, "wss://stream.binance.com:9443"),
+    (BinanceAccountType.MARGIN, False, False, "wss://stream.binance.com:9443"),
+    (BinanceAccountType.ISOLATED_MARGIN, False, False, "wss://stream.binance.com:9443"),
+    (BinanceAccountType.USDT_FUTURE, False, False, "wss://fstream.binance.com"),
+    (BinanceAccountType.COIN_FUTURE, False, False, "wss://dstream.binance.com"),
+    (BinanceAccountType.SPOT, False, True, "wss://stream.binance.us:9443"),
+    (BinanceAccountType.MARGIN, False, True, "wss://stream.binance.us:9443"),
+    (BinanceAccountType.ISOLATED_MARGIN, False, True, "wss://stream.binance.us:9443"),
+    (BinanceAccountType.USDT_FUTURE, False, True, "wss://fstream.binance.us"),
+    (BinanceAccountType.COIN_FUTURE, False, True, "wss://dstream.binance.us"),
+    (BinanceAccountType.SPOT, True, False, "wss://testnet.binance.vision"),
+    (BinanceAccountType.MARGIN, True, False, "wss://testnet.binance.vision"),
+    (BinanceAccountType.ISOLATED_MARGIN, True, False, "wss://testnet.binance.vision"),
+    (BinanceAccountType.USDT_FUTURE, True, False, "wss://stream.binancefuture.com"),
+]
+
+
+URL_CASES = [
+    (get_base_url, *case)
+    for get_base_url, cases in (
+        (get_http_base_url, HTTP_BASE_URL_CASES),
+        (get_ws_base_url, WS_BASE_URL_CASES),
+    )
+    for case in cases
+]
 
-        self.msgbus = MessageBus(
-            trader_id=self.trader_id,
-            clock=self.clock,
-        )
 
-        self.cache_db = MockCacheDatabase()
+def _url_case_id(case: tuple[Callable, BinanceAccountType, bool, bool, str]) -> str:
+    get_base_url, account_type, is_testnet, is_us, _ = case
+    scheme = "http" if get_base_url is get_http_base_url else "ws"
+    tld = "us" if is_us else "com"
+    env = "test" if is_testnet else "prod"
+    return f"{scheme}-{account_type.name}-{tld}-{env}"
 
-        self.cache = Cache(
-            database=self.cache_db,
-        )
 
-    @pytest.mark.parametrize(
-        ("account_type", "is_testnet", "is_us", "expected"),
-        [
-            [
-                BinanceAccountType.SPOT,
-                False,
-                False,
-                "https://api.binance.com",
-            ],
-            [
-                BinanceAccountType.MARGIN,
-                False,
-                False,
-                "https://sapi.binance.com",
-            ],
-            [
-                BinanceAccountType.ISOLATED_MARGIN,
-                False,
-                False,
-                "https://sapi.binance.com",
-            ],
-            [
-                BinanceAccountType.USDT_FUTURE,
-                False,
-                False,
-                "https://fapi.binance.com",
-            ],
-            [
-                BinanceAccountType.COIN_FUTURE,
-                False,
-                False,
-                "https://dapi.binance.com",
-            ],
-            [
-                BinanceAccountType.SPOT,
-                False,
-                True,
-                "https://api.binance.us",
-            ],
-            [
-                BinanceAccountType.MARGIN,
-                False,
-                True,
-                "https://sapi.binance.us",
-            ],
-            [
-                BinanceAccountType.ISOLATED_MARGIN,
-                False,
-                True,
-                "https://sapi.binance.us",
-            ],
-            [
-                BinanceAccountType.USDT_FUTURE,
-                False,
-                True,
-                "https://fapi.binance.us",
-            ],
-            [
-                BinanceAccountType.COIN_FUTURE,
-                False,
-                True,
-                "https://dapi.binance.us",
-            ],
-            [
-                BinanceAccountType.SPOT,
-                True,
-                False,
-                "https://testnet.binance.vision",
-            ],
-            [
-                BinanceAccountType.MARGIN,
-                True,
-                False,
-                "https://testnet.binance.vision",
-            ],
-            [
-                BinanceAccountType.ISOLATED_MARGIN,
-                True,
-                False,
-                "https://testnet.binance.vision",
-            ],
-            [
-                BinanceAccountType.USDT_FUTURE,
-                True,
-                False,
-                "https://testnet.binancefuture.com",
-            ],
-        ],
-    )
-    def test_get_http_base_url(self, account_type, is_testnet, is_us, expected):
-        # Arrange, Act
-        base_url = get_http_base_url(account_type, is_testnet, is_us)
+@pytest.mark.gc_paused
+class TestBinanceFactories:
+    @pytest.fixture(autouse=True, scope="class")
+    def _shared_fixtures(self, request, loop):
+        # Fixture Setup (built once per class, the factories do not mutate these)
+        cls = request.cls
+        cls.loop = loop
+        cls.clock = LiveClock()
+        cls.trader_id = TestIdStubs.trader_id()
+        cls.strategy_id = TestIdStubs.strategy_id()
+        cls.account_id = TestIdStubs.account_id()
+
+        cls.msgbus = MessageBus(
+            trader_id=cls.trader_id,
+            clock=cls.clock,
+        )
 
-        # Assert
-        assert base_url == expected
+        cls.cache = TestComponentStubs.cache()
 
     @pytest.mark.parametrize(
-        ("account_type", "is_testnet", "is_us", "expected"),
-        [
-            [
-                BinanceAccountType.SPOT,
-                False,
-                False,
-                "wss://stream.binance.com:9443",
-            ],
-            [
-                BinanceAccountType.MARGIN,
-                False,
-                False,
-                "wss://stream.binance.com:9443",
-            ],
-            [
-                BinanceAccountType.ISOLATED_MARGIN,
-                False,
-                False,
-                "wss://stream.binance.com:9443",
-            ],
-            [
-                BinanceAccountType.USDT_FUTURE,
-                False,
-                False,
-                "wss://fstream.binance.com",
-            ],
-            [
-                BinanceAccountType.COIN_FUTURE,
-                False,
-                False,
-                "wss://dstream.binance.com",
-            ],
-            [
-                BinanceAccountType.SPOT,
-                False,
-                True,
-                "wss://stream.binance.us:9443",
-            ],
-            [
-                BinanceAccountType.MARGIN,
-                False,
-                True,
-                "wss://stream.binance.us:9443",
-            ],
-            [
-                BinanceAccountType.ISOLATED_MARGIN,
-                False,
-                True,
-                "wss://stream.binance.us:9443",
-            ],
-            [
-                BinanceAccountType.USDT_FUTURE,
-                False,
-                True,
-                "wss://fstream.binance.us",
-            ],
-            [
-                BinanceAccountType.COIN_FUTURE,
-                False,
-                True,
-                "wss://dstream.binance.us",
-            ],
-            [
-                BinanceAccountType.SPOT,
-                True,
-                False,
-                "wss://testnet.binance.vision",
-            ],
-            [
-                BinanceAccountType.MARGIN,
-                True,
-                False,
-                "wss://testnet.binance.vision",
-            ],
-            [
-                BinanceAccountType.ISOLATED_MARGIN,
-                True,
-                False,
-                "wss://testnet.binance.vision",
-            ],
-            [
-                BinanceAccountType.USDT_FUTURE,
-                True,
-                False,
-                "wss://stream.binancefuture.com",
-            ],
-        ],
+        ("get_base_url", "account_type", "is_testnet", "is_us", "expected"),
+        URL_CASES,
+        ids=[_url_case_id(case) for case in URL_CASES],
     )
-    def test_get_ws_base_url(self, account_type, is_testnet, is_us, expected):
+    def test_get_base_url(self, get_base_url, account_type, is_testnet, is_us, expected):
         # Arrange, Act
-        base_url = get_ws_base_url(account_type, is_testnet, is_us)
+        base_url = get_base_url(account_type, is_testnet, is_us)
 
         # Assert
         assert base_url == expected
@@ -252,11 +148,7 @@ class TestBinanceFactories:
         data_client = BinanceLiveDataClientFactory.create(
             loop=self.loop,
             name="BINANCE",
-            config=BinanceDataClientConfig(  # (S106 Possible hardcoded password)
-                api_key="SOME_BINANCE_API_KEY",  # Do not remove or will fail in CI
-                api_secret="SOME_BINANCE_API_SECRET",  # Do not remove or will fail in CI
-                account_type=BinanceAccountType.SPOT,
-            ),
+            config=SPOT_DATA_CONFIG,
             msgbus=self.msgbus,
             cache=self.cache,
             clock=self.clock,
@@ -269,11 +161,7 @@ class TestBinanceFactories:
         data_client = BinanceLiveDataClientFactory.create(
             loop=self.loop,
             name="BINANCE",
-            config=BinanceDataClientConfig(  # (S106 Possible hardcoded password)
-                api_key="SOME_BINANCE_API_KEY",  # Do not remove or will fail in CI
-                api_secret="SOME_BINANCE_API_SECRET",  # Do not remove or will fail in CI
-                account_type=BinanceAccountType.USDT_FUTURE,
-            ),
+            config=FUTURES_DATA_CONFIG,
             msgbus=self.msgbus,
             cache=self.cache,
             clock=self.clock,
@@ -286,11 +174,7 @@ class TestBinanceFactories:
         exec_client = BinanceLiveExecClientFactory.create(
             loop=self.loop,
             name="BINANCE",
-            config=BinanceExecClientConfig(  # (S106 Possible hardcoded password)
-                api_key="SOME_BINANCE_API_KEY",  # Do not remove or will fail in CI
-                api_secret="SOME_BINANCE_API_SECRET",  # Do not remove or will fail in CI
-                account_type=BinanceAccountType.SPOT,
-            ),
+            config=SPOT_EXEC_CONFIG,
             msgbus=self.msgbus,
             cache=self.cache,
             clock=self.clock,
@@ -303,11 +187,7 @@ class TestBinanceFactories:
         exec_client = BinanceLiveExecClientFactory.create(
             loop=self.loop,
             name="BINANCE",
-            config=BinanceExecClientConfig(  # (S106 Possible hardcoded password)
-                api_key="SOME_BINANCE_API_KEY",
-                api_secret="SOME_BINANCE_API_SECRET",
-                account_type=BinanceAccountType.USDT_FUTURE,
-            ),
+            config=FUTURES_EXEC_CONFIG,
             msgbus=self.msgbus,
             cache=self.cache,
             clock=self.clock,
@@ -26,10 +26,9 @@ from nautilus_trader.adapters.bybit.data import BybitDataClient
 from nautilus_trader.adapters.bybit.execution import BybitExecutionClient
 from nautilus_trader.adapters.bybit.factories import BybitLiveDataClientFactory
 from nautilus_trader.adapters.bybit.factories import BybitLiveExecClientFactory
-from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import MessageBus
-from nautilus_trader.test_kit.mocks.cache_database import MockCacheDatabase
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
@@ -47,8 +46,7 @@ class TestBybitFactories:
             clock=self.clock,
         )
 
-        self.cache_db = MockCacheDatabase()
-        self.cache = Cache(database=self.cache_db)
+        self.cache = TestComponentStubs.cache()
 
     @pytest.mark.parametrize(
         ("is_demo", "is_testnet", "expected"),
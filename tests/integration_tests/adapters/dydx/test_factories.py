@@ -26,11 +26,10 @@ from nautilus_trader.adapters.dydx.common.urls import get_ws_base_url
 from nautilus_trader.adapters.dydx.config import DYDXDataClientConfig
 from nautilus_trader.adapters.dydx.data import DYDXDataClient
 from nautilus_trader.adapters.dydx.factories import DYDXLiveDataClientFactory
-from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.model.identifiers import TraderId
-from nautilus_trader.test_kit.mocks.cache_database import MockCacheDatabase
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
 
 
 @pytest.mark.parametrize(
@@ -88,7 +87,7 @@ def test_create_dydx_live_data_client() -> None:
         trader_id=TraderId("TESTER-000"),
         clock=clock,
     )
-    cache = Cache(database=MockCacheDatabase())
+    cache = TestComponentStubs.cache()
 
     # Act
     data_client = DYDXLiveDataClientFactory.create(
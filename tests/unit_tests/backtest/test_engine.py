@@ -77,15 +77,24 @@ AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
+STARTING_CAPITAL = Money(1_000_000, USD)
+
 
 class TestBacktestEngine:
-    def setup(self):
+    @pytest.fixture(autouse=True)
+    def setup_engine(self, usdjpy_quote_ticks):
         # Fixture Setup
-        self.usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        self._ticks = usdjpy_quote_ticks
+        self.usdjpy = USDJPY_SIM
         self.engine = self.create_engine(
             BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)),
         )
 
+        yield
+
+        self.engine.reset()
+        self.engine.dispose()
+
     def create_engine(self, config: BacktestEngineConfig | None = None) -> BacktestEngine:
         engine = BacktestEngine(config)
         engine.add_venue(
@@ -93,25 +102,15 @@ class TestBacktestEngine:
             oms_type=OmsType.HEDGING,
             account_type=AccountType.MARGIN,
             base_currency=USD,
-            starting_balances=[Money(1_000_000, USD)],
+            starting_balances=[STARTING_CAPITAL],
             fill_model=FillModel(),
         )
 
         # Setup data
-        wrangler = QuoteTickDataWrangler(self.usdjpy)
-        provider = TestDataProvider()
-        ticks = wrangler.process_bar_data(
-            bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:2000],
-            ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")[:2000],
-        )
         engine.add_instrument(USDJPY_SIM)
-        engine.add_data(ticks)
+        engine.add_data(self._ticks)
         return engine
 
-    def teardown(self):
-        self.engine.reset()
-        self.engine.dispose()
-
     def test_initialization(self):
         engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
 
@@ -327,7 +326,7 @@ class TestBacktestEngineCashAccount:
             oms_type=OmsType.HEDGING,
             account_type=AccountType.CASH,
             base_currency=USD,
-            starting_balances=[Money(1_000_000, USD)],
+            starting_balances=[STARTING_CAPITAL],
             fill_model=FillModel(),
         )
         return engine
@@ -360,7 +359,7 @@ class TestBacktestEngineData:
             oms_type=OmsType.HEDGING,
             account_type=AccountType.MARGIN,
             base_currency=USD,
-            starting_balances=[Money(1_000_000, USD)],
+            starting_balances=[STARTING_CAPITAL],
             fill_model=FillModel(),
         )
 
@@ -605,7 +604,7 @@ class TestBacktestEngineData:
             instrument=USDJPY_SIM,
         )
         provider = TestDataProvider()
-        bars = wrangler.process(provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:2000])
+        bars = wrangler.process(provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv").iloc[:2000])
 
         # Act
         self.engine.add_instrument(USDJPY_SIM)
@@ -656,7 +655,7 @@ class TestBacktestWithAddedBars:
             oms_type=OmsType.HEDGING,
             account_type=AccountType.MARGIN,
             base_currency=USD,
-            starting_balances=[Money(1_000_000, USD)],
+            starting_balances=[STARTING_CAPITAL],
         )
 
         # Setup data
@@ -77,7 +77,10 @@ from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 _AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 _USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
+STARTING_CAPITAL = Money(1_000_000, USD)
 
+
+@pytest.mark.gc_paused
 class TestSimulatedExchangeMarginAccount:
     def setup(self) -> None:
         # Fixture Setup
@@ -123,7 +126,7 @@ class TestSimulatedExchangeMarginAccount:
             oms_type=OmsType.HEDGING,
             account_type=AccountType.MARGIN,
             base_currency=USD,
-            starting_balances=[Money(1_000_000, USD)],
+            starting_balances=[STARTING_CAPITAL],
             default_leverage=Decimal(50),
             leverages={_AUDUSD_SIM.id: Decimal(10)},
             modules=[],
@@ -2731,7 +2734,7 @@ class TestSimulatedExchangeMarginAccount:
             oms_type=OmsType.HEDGING,
             account_type=AccountType.MARGIN,
             base_currency=USD,
-            starting_balances=[Money(1_000_000, USD)],
+            starting_balances=[STARTING_CAPITAL],
             default_leverage=Decimal(50),
             leverages={},
             modules=[],
@@ -3030,7 +3033,7 @@ class TestSimulatedExchangeL1:
             oms_type=OmsType.HEDGING,
             account_type=AccountType.MARGIN,
             base_currency=USD,
-            starting_balances=[Money(1_000_000, USD)],
+            starting_balances=[STARTING_CAPITAL],
             default_leverage=Decimal(50),
             leverages={_AUDUSD_SIM.id: Decimal(10)},
             modules=[self.module],
@@ -74,7 +74,16 @@ AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
 _USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
+STARTING_CAPITAL = Money(1_000_000, USD)
 
+QTY_100K = Quantity.from_int(100_000)
+PRICE_90_000 = Price.from_str("90.000")
+PRICE_90_500 = Price.from_str("90.500")
+PRICE_90_001 = Price.from_str("90.001")
+PRICE_90_006 = Price.from_str("90.006")
+
+
+@pytest.mark.gc_paused
 class TestStrategy:
     def setup(self) -> None:
         # Fixture Setup
@@ -118,7 +127,7 @@ class TestStrategy:
             oms_type=OmsType.HEDGING,
             account_type=AccountType.MARGIN,
             base_currency=USD,
-            starting_balances=[Money(1_000_000, USD)],
+            starting_balances=[STARTING_CAPITAL],
             default_leverage=Decimal(50),
             leverages={},
             portfolio=self.portfolio,
@@ -174,6 +183,16 @@ class TestStrategy:
         self.data_engine.start()
         self.exec_engine.start()
 
+    def _register_strategy(self, strategy: Strategy) -> Strategy:
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        return strategy
+
     def test_strategy_to_importable_config_with_no_specific_config(self) -> None:
         # Arrange
         config = StrategyConfig()
@@ -252,14 +271,7 @@ class TestStrategy:
 
     def test_initialization(self) -> None:
         # Arrange
-        strategy = Strategy(config=StrategyConfig(order_id_tag="001"))
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config=StrategyConfig(order_id_tag="001")))
 
         # Act, Assert
         assert strategy.state == ComponentState.READY
@@ -267,14 +279,7 @@ class TestStrategy:
 
     def test_on_save_when_not_overridden_does_nothing(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         # Act
         strategy.on_save()
@@ -284,14 +289,7 @@ class TestStrategy:
 
     def test_on_load_when_not_overridden_does_nothing(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         # Act
         strategy.on_load({})
@@ -303,14 +301,7 @@ class TestStrategy:
         # Arrange
         config = StrategyConfig()
 
-        strategy = Strategy(config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config))
         strategy.save()
 
         # Assert
@@ -318,14 +309,7 @@ class TestStrategy:
 
     def test_save_when_user_code_raises_error_logs_and_reraises(self) -> None:
         # Arrange
-        strategy = KaboomStrategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(KaboomStrategy())
 
         # Act, Assert
         with pytest.raises(RuntimeError):
@@ -333,14 +317,7 @@ class TestStrategy:
 
     def test_load_when_user_code_raises_error_logs_and_reraises(self) -> None:
         # Arrange
-        strategy = KaboomStrategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(KaboomStrategy())
 
         # Act, Assert
         with pytest.raises(RuntimeError):
@@ -348,14 +325,7 @@ class TestStrategy:
 
     def test_load(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         state: dict[str, bytes] = {}
 
@@ -369,14 +339,7 @@ class TestStrategy:
     def test_reset(self) -> None:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
-        strategy = MockStrategy(bar_type)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(MockStrategy(bar_type))
 
         bar = Bar(
             bar_type,
@@ -384,7 +347,7 @@ class TestStrategy:
             Price.from_str("1.00004"),
             Price.from_str("1.00000"),
             Price.from_str("1.00003"),
-            Quantity.from_int(100_000),
+            QTY_100K,
             0,
             0,
         )
@@ -403,14 +366,7 @@ class TestStrategy:
     def test_dispose(self) -> None:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
-        strategy = MockStrategy(bar_type)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(MockStrategy(bar_type))
 
         strategy.reset()
 
@@ -424,14 +380,7 @@ class TestStrategy:
     def test_save_load(self) -> None:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
-        strategy = MockStrategy(bar_type)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(MockStrategy(bar_type))
 
         # Act
         state = strategy.save()
@@ -444,14 +393,7 @@ class TestStrategy:
 
     def test_register_indicator_for_quote_ticks_when_already_registered(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema1 = ExponentialMovingAverage(10, price_type=PriceType.MID)
         ema2 = ExponentialMovingAverage(10, price_type=PriceType.MID)
@@ -467,14 +409,7 @@ class TestStrategy:
 
     def test_register_indicator_for_trade_ticks_when_already_registered(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema1 = ExponentialMovingAverage(10)
         ema2 = ExponentialMovingAverage(10)
@@ -490,14 +425,7 @@ class TestStrategy:
 
     def test_register_indicator_for_bars_when_already_registered(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema1 = ExponentialMovingAverage(10)
         ema2 = ExponentialMovingAverage(10)
@@ -514,14 +442,7 @@ class TestStrategy:
 
     def test_register_indicator_for_multiple_data_sources(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema = ExponentialMovingAverage(10)
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
@@ -537,14 +458,7 @@ class TestStrategy:
 
     def test_handle_quote_tick_updates_indicator_registered_for_quote_ticks(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema = ExponentialMovingAverage(10, price_type=PriceType.MID)
         strategy.register_indicator_for_quote_ticks(AUDUSD_SIM.id, ema)
@@ -560,14 +474,7 @@ class TestStrategy:
 
     def test_handle_quote_ticks_with_no_ticks_logs_and_continues(self) -> None:
         # Arrange
-        strategy = KaboomStrategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(KaboomStrategy())
 
         ema = ExponentialMovingAverage(10, price_type=PriceType.MID)
         strategy.register_indicator_for_quote_ticks(AUDUSD_SIM.id, ema)
@@ -580,14 +487,7 @@ class TestStrategy:
 
     def test_handle_quote_ticks_updates_indicator_registered_for_quote_ticks(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema = ExponentialMovingAverage(10, price_type=PriceType.MID)
         strategy.register_indicator_for_quote_ticks(AUDUSD_SIM.id, ema)
@@ -602,14 +502,7 @@ class TestStrategy:
 
     def test_handle_trade_tick_updates_indicator_registered_for_trade_ticks(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema = ExponentialMovingAverage(10)
         strategy.register_indicator_for_trade_ticks(AUDUSD_SIM.id, ema)
@@ -625,14 +518,7 @@ class TestStrategy:
 
     def test_handle_trade_ticks_updates_indicator_registered_for_trade_ticks(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema = ExponentialMovingAverage(10)
         strategy.register_indicator_for_trade_ticks(AUDUSD_SIM.id, ema)
@@ -647,14 +533,7 @@ class TestStrategy:
 
     def test_handle_trade_ticks_with_no_ticks_logs_and_continues(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema = ExponentialMovingAverage(10)
         strategy.register_indicator_for_trade_ticks(AUDUSD_SIM.id, ema)
@@ -668,14 +547,7 @@ class TestStrategy:
     def test_handle_bar_updates_indicator_registered_for_bars(self) -> None:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema = ExponentialMovingAverage(10)
         strategy.register_indicator_for_bars(bar_type, ema)
@@ -691,14 +563,7 @@ class TestStrategy:
     def test_handle_bars_updates_indicator_registered_for_bars(self) -> None:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema = ExponentialMovingAverage(10)
         strategy.register_indicator_for_bars(bar_type, ema)
@@ -713,14 +578,7 @@ class TestStrategy:
     def test_handle_bars_with_no_bars_logs_and_continues(self) -> None:
         # Arrange
         bar_type = TestDataStubs.bartype_gbpusd_1sec_mid()
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         ema = ExponentialMovingAverage(10)
         strategy.register_indicator_for_bars(bar_type, ema)
@@ -734,14 +592,7 @@ class TestStrategy:
     def test_stop_cancels_a_running_time_alert(self) -> None:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
-        strategy = MockStrategy(bar_type)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(MockStrategy(bar_type))
 
         alert_time = datetime.now(pytz.utc) + timedelta(milliseconds=200)
         strategy.clock.set_time_alert("test_alert1", alert_time)
@@ -756,14 +607,7 @@ class TestStrategy:
     def test_stop_cancels_a_running_timer(self) -> None:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
-        strategy = MockStrategy(bar_type)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(MockStrategy(bar_type))
 
         start_time = datetime.now(pytz.utc) + timedelta(milliseconds=100)
         strategy.clock.set_timer(
@@ -783,19 +627,12 @@ class TestStrategy:
     def test_start_when_manage_gtd_reactivates_timers(self) -> None:
         # Arrange
         config = StrategyConfig(manage_gtd_expiry=True)
-        strategy = Strategy(config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config))
 
         order1 = strategy.order_factory.limit(
             _USDJPY_SIM.id,
             OrderSide.SELL,
-            Quantity.from_int(100_000),
+            QTY_100K,
             _USDJPY_SIM.make_price(100.000),
             time_in_force=TimeInForce.GTD,
             expire_time=self.clock.utc_now() + pd.Timedelta(minutes=10),
@@ -803,7 +640,7 @@ class TestStrategy:
         order2 = strategy.order_factory.limit(
             _USDJPY_SIM.id,
             OrderSide.SELL,
-            Quantity.from_int(100_000),
+            QTY_100K,
             _USDJPY_SIM.make_price(101.000),
             time_in_force=TimeInForce.GTD,
             expire_time=self.clock.utc_now() + pd.Timedelta(minutes=11),
@@ -827,19 +664,12 @@ class TestStrategy:
     def test_start_when_manage_gtd_and_order_past_expiration_then_cancels(self) -> None:
         # Arrange
         config = StrategyConfig(manage_gtd_expiry=True)
-        strategy = Strategy(config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config))
 
         order1 = strategy.order_factory.limit(
             _USDJPY_SIM.id,
             OrderSide.SELL,
-            Quantity.from_int(100_000),
+            QTY_100K,
             _USDJPY_SIM.make_price(100.000),
             time_in_force=TimeInForce.GTD,
             expire_time=self.clock.utc_now() + pd.Timedelta(minutes=10),
@@ -860,19 +690,12 @@ class TestStrategy:
 
     def test_submit_order_when_duplicate_id_then_denies(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order1 = strategy.order_factory.market(
             AUDUSD_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
         )
 
         order2 = MarketOrder(
@@ -881,7 +704,7 @@ class TestStrategy:
             AUDUSD_SIM.id,
             order1.client_order_id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             UUID4(),
             0,
             TimeInForce.DAY,
@@ -896,19 +719,12 @@ class TestStrategy:
 
     def test_submit_order_with_valid_order_successfully_submits(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order = strategy.order_factory.market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
         )
 
         # Act
@@ -925,19 +741,12 @@ class TestStrategy:
     def test_submit_order_with_managed_gtd_starts_timer(self) -> None:
         # Arrange
         config = StrategyConfig(manage_gtd_expiry=True)
-        strategy = Strategy(config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config))
 
         order = strategy.order_factory.limit(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             price=Price.from_str("100.000"),
             time_in_force=TimeInForce.GTD,
             expire_time=UNIX_EPOCH + timedelta(minutes=1),
@@ -953,19 +762,12 @@ class TestStrategy:
     def test_submit_order_with_managed_gtd_when_immediately_filled_cancels_timer(self) -> None:
         # Arrange
         config = StrategyConfig(manage_gtd_expiry=True)
-        strategy = Strategy(config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config))
 
         order = strategy.order_factory.limit(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             price=Price.from_str("100.000"),
             time_in_force=TimeInForce.GTD,
             expire_time=UNIX_EPOCH + timedelta(minutes=1),
@@ -981,19 +783,12 @@ class TestStrategy:
 
     def test_submit_order_list_with_duplicate_order_list_id_then_denies(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         bracket1 = strategy.order_factory.bracket(
             instrument_id=AUDUSD_SIM.id,
             order_side=OrderSide.BUY,
-            quantity=Quantity.from_int(100_000),
+            quantity=QTY_100K,
             sl_trigger_price=Price.from_str("1.00000"),
             tp_price=Price.from_str("1.00100"),
             emulation_trigger=TriggerType.BID_ASK,
@@ -1002,20 +797,20 @@ class TestStrategy:
         entry = strategy.order_factory.market(
             AUDUSD_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
         )
 
         stop_loss = strategy.order_factory.stop_market(
             AUDUSD_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             Price.from_str("1.00000"),
         )
 
         take_profit = strategy.order_factory.limit(
             AUDUSD_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             Price.from_str("1.10000"),
         )
 
@@ -1044,19 +839,12 @@ class TestStrategy:
 
     def test_submit_order_list_with_duplicate_order_id_then_denies(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         bracket1 = strategy.order_factory.bracket(
             instrument_id=AUDUSD_SIM.id,
             order_side=OrderSide.BUY,
-            quantity=Quantity.from_int(100_000),
+            quantity=QTY_100K,
             sl_trigger_price=Price.from_str("1.00000"),
             tp_price=Price.from_str("1.00100"),
             emulation_trigger=TriggerType.BID_ASK,
@@ -1065,14 +853,14 @@ class TestStrategy:
         stop_loss = strategy.order_factory.stop_market(
             AUDUSD_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             Price.from_str("1.00000"),
         )
 
         take_profit = strategy.order_factory.limit(
             AUDUSD_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             Price.from_str("1.10000"),
         )
 
@@ -1100,22 +888,15 @@ class TestStrategy:
 
     def test_submit_order_list_with_valid_order_successfully_submits(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         bracket = strategy.order_factory.bracket(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             entry_price=Price.from_str("80.000"),
-            sl_trigger_price=Price.from_str("90.000"),
-            tp_price=Price.from_str("90.500"),
+            sl_trigger_price=PRICE_90_000,
+            tp_price=PRICE_90_500,
             entry_order_type=OrderType.LIMIT,
         )
 
@@ -1134,22 +915,15 @@ class TestStrategy:
     def test_submit_order_list_with_managed_gtd_starts_timer(self) -> None:
         # Arrange
         config = StrategyConfig(manage_gtd_expiry=True)
-        strategy = Strategy(config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config))
 
         bracket = strategy.order_factory.bracket(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             entry_price=Price.from_str("80.000"),
             sl_trigger_price=Price.from_str("70.000"),
-            tp_price=Price.from_str("90.500"),
+            tp_price=PRICE_90_500,
             entry_order_type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTD,
             expire_time=UNIX_EPOCH + timedelta(minutes=1),
@@ -1166,22 +940,15 @@ class TestStrategy:
     def test_submit_order_list_with_managed_gtd_when_immediately_filled_cancels_timer(self) -> None:
         # Arrange
         config = StrategyConfig(manage_gtd_expiry=True)
-        strategy = Strategy(config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config))
 
         bracket = strategy.order_factory.bracket(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             entry_price=Price.from_str("90.100"),
             sl_trigger_price=Price.from_str("70.000"),
-            tp_price=Price.from_str("90.500"),
+            tp_price=PRICE_90_500,
             entry_order_type=OrderType.LIMIT,
             time_in_force=TimeInForce.GTD,
             expire_time=UNIX_EPOCH + timedelta(minutes=1),
@@ -1200,19 +967,12 @@ class TestStrategy:
     def test_cancel_gtd_expiry(self) -> None:
         # Arrange
         config = StrategyConfig(manage_gtd_expiry=True)
-        strategy = Strategy(config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config))
 
         order = strategy.order_factory.limit(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             price=Price.from_str("100.000"),
             time_in_force=TimeInForce.GTD,
             expire_time=UNIX_EPOCH + timedelta(minutes=1),
@@ -1228,20 +988,13 @@ class TestStrategy:
 
     def test_cancel_order(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order = strategy.order_factory.stop_market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
-            Price.from_str("90.006"),
+            QTY_100K,
+            PRICE_90_006,
         )
 
         strategy.submit_order(order)
@@ -1262,20 +1015,13 @@ class TestStrategy:
 
     def test_cancel_order_when_pending_cancel_does_not_submit_command(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order = strategy.order_factory.stop_market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
-            Price.from_str("90.006"),
+            QTY_100K,
+            PRICE_90_006,
         )
 
         strategy.submit_order(order)
@@ -1295,20 +1041,13 @@ class TestStrategy:
 
     def test_cancel_order_when_closed_does_not_submit_command(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order = strategy.order_factory.stop_market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
-            Price.from_str("90.006"),
+            QTY_100K,
+            PRICE_90_006,
         )
 
         strategy.submit_order(order)
@@ -1328,20 +1067,13 @@ class TestStrategy:
 
     def test_modify_order_when_pending_cancel_does_not_submit_command(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order = strategy.order_factory.limit(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
-            Price.from_str("90.001"),
+            QTY_100K,
+            PRICE_90_001,
         )
 
         strategy.submit_order(order)
@@ -1351,8 +1083,8 @@ class TestStrategy:
         # Act
         strategy.modify_order(
             order=order,
-            quantity=Quantity.from_int(100_000),
-            price=Price.from_str("90.000"),
+            quantity=QTY_100K,
+            price=PRICE_90_000,
         )
         self.exchange.process(0)
 
@@ -1361,20 +1093,13 @@ class TestStrategy:
 
     def test_modify_order_when_closed_does_not_submit_command(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order = strategy.order_factory.limit(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
-            Price.from_str("90.001"),
+            QTY_100K,
+            PRICE_90_001,
         )
 
         strategy.submit_order(order)
@@ -1384,8 +1109,8 @@ class TestStrategy:
         # Act
         strategy.modify_order(
             order=order,
-            quantity=Quantity.from_int(100_000),
-            price=Price.from_str("90.000"),
+            quantity=QTY_100K,
+            price=PRICE_90_000,
         )
         self.exchange.process(0)
 
@@ -1394,20 +1119,13 @@ class TestStrategy:
 
     def test_modify_order_when_no_changes_does_not_submit_command(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order = strategy.order_factory.limit(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
-            Price.from_str("90.001"),
+            QTY_100K,
+            PRICE_90_001,
         )
 
         strategy.submit_order(order)
@@ -1415,8 +1133,8 @@ class TestStrategy:
         # Act
         strategy.modify_order(
             order=order,
-            quantity=Quantity.from_int(100_000),
-            price=Price.from_str("90.001"),
+            quantity=QTY_100K,
+            price=PRICE_90_001,
         )
 
         # Assert
@@ -1424,20 +1142,13 @@ class TestStrategy:
 
     def test_modify_order(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order = strategy.order_factory.limit(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
-            Price.from_str("90.000"),
+            QTY_100K,
+            PRICE_90_000,
         )
 
         strategy.submit_order(order)
@@ -1447,7 +1158,7 @@ class TestStrategy:
         strategy.modify_order(
             order=order,
             quantity=Quantity.from_int(110000),
-            price=Price.from_str("90.001"),
+            price=PRICE_90_001,
         )
         self.exchange.process(0)
 
@@ -1455,7 +1166,7 @@ class TestStrategy:
         assert strategy.cache.orders()[0] == order
         assert strategy.cache.orders()[0].status == OrderStatus.ACCEPTED
         assert strategy.cache.orders()[0].quantity == Quantity.from_int(110_000)
-        assert strategy.cache.orders()[0].price == Price.from_str("90.001")
+        assert strategy.cache.orders()[0].price == PRICE_90_001
         assert strategy.cache.order_exists(order.client_order_id)
         assert strategy.cache.is_order_open(order.client_order_id)
         assert not strategy.cache.is_order_closed(order.client_order_id)
@@ -1463,27 +1174,20 @@ class TestStrategy:
 
     def test_cancel_orders(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order1 = strategy.order_factory.stop_market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             Price.from_str("90.007"),
         )
 
         order2 = strategy.order_factory.stop_market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
-            Price.from_str("90.006"),
+            QTY_100K,
+            PRICE_90_006,
         )
 
         strategy.submit_order(order1)
@@ -1500,27 +1204,20 @@ class TestStrategy:
 
     def test_cancel_all_orders(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order1 = strategy.order_factory.stop_market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             Price.from_str("90.007"),
         )
 
         order2 = strategy.order_factory.stop_market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
-            Price.from_str("90.006"),
+            QTY_100K,
+            PRICE_90_006,
         )
 
         strategy.submit_order(order1)
@@ -1542,25 +1239,18 @@ class TestStrategy:
 
     def test_close_position_when_position_already_closed_does_nothing(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order1 = strategy.order_factory.market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
         )
 
         order2 = strategy.order_factory.market(
             _USDJPY_SIM.id,
             OrderSide.SELL,
-            Quantity.from_int(100_000),
+            QTY_100K,
         )
 
         strategy.submit_order(order1)
@@ -1581,19 +1271,12 @@ class TestStrategy:
 
     def test_close_position(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
 
         order = strategy.order_factory.market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
         )
 
         strategy.submit_order(order)
@@ -1615,26 +1298,19 @@ class TestStrategy:
 
     def test_close_all_positions(self) -> None:
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy())
         strategy.start()
 
         order1 = strategy.order_factory.market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
         )
 
         order2 = strategy.order_factory.market(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
         )
 
         strategy.submit_order(order1)
@@ -1671,23 +1347,16 @@ class TestStrategy:
             manage_contingent_orders=True,
             manage_gtd_expiry=True,
         )
-        strategy = Strategy(config=config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config=config))
         strategy.start()
 
         bracket = strategy.order_factory.bracket(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             entry_price=Price.from_str("80.000"),
-            sl_trigger_price=Price.from_str("90.000"),
-            tp_price=Price.from_str("90.500"),
+            sl_trigger_price=PRICE_90_000,
+            tp_price=PRICE_90_500,
             entry_order_type=OrderType.LIMIT,
             contingency_type=contingency_type,
         )
@@ -1720,22 +1389,15 @@ class TestStrategy:
             manage_contingent_orders=True,
             manage_gtd_expiry=True,
         )
-        strategy = Strategy(config=config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config=config))
         strategy.start()
 
         bracket = strategy.order_factory.bracket(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
-            sl_trigger_price=Price.from_str("90.000"),
-            tp_price=Price.from_str("90.500"),
+            QTY_100K,
+            sl_trigger_price=PRICE_90_000,
+            tp_price=PRICE_90_500,
             entry_order_type=OrderType.MARKET,
             contingency_type=contingency_type,
         )
@@ -1760,22 +1422,15 @@ class TestStrategy:
             manage_contingent_orders=True,
             manage_gtd_expiry=True,
         )
-        strategy = Strategy(config=config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config=config))
         strategy.start()
 
         bracket = strategy.order_factory.bracket(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
-            sl_trigger_price=Price.from_str("90.000"),
-            tp_price=Price.from_str("90.500"),
+            QTY_100K,
+            sl_trigger_price=PRICE_90_000,
+            tp_price=PRICE_90_500,
             entry_order_type=OrderType.MARKET,
             contingency_type=ContingencyType.OUO,
         )
@@ -1810,24 +1465,17 @@ class TestStrategy:
             manage_contingent_orders=True,
             manage_gtd_expiry=True,
         )
-        strategy = Strategy(config=config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config=config))
         strategy.start()
 
         bracket = strategy.order_factory.bracket(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             entry_trigger_price=Price.from_str("90.101"),
             entry_price=Price.from_str("90.100"),
-            sl_trigger_price=Price.from_str("90.000"),
-            tp_price=Price.from_str("90.500"),
+            sl_trigger_price=PRICE_90_000,
+            tp_price=PRICE_90_500,
             entry_order_type=OrderType.LIMIT_IF_TOUCHED,
             contingency_type=contingency_type,
         )
@@ -1865,24 +1513,17 @@ class TestStrategy:
             manage_contingent_orders=True,
             manage_gtd_expiry=True,
         )
-        strategy = Strategy(config=config)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-        )
+        strategy = self._register_strategy(Strategy(config=config))
         strategy.start()
 
         bracket = strategy.order_factory.bracket(
             _USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100_000),
+            QTY_100K,
             entry_trigger_price=Price.from_str("90.101"),
             entry_price=Price.from_str("90.100"),
-            sl_trigger_price=Price.from_str("90.000"),
-            tp_price=Price.from_str("90.500"),
+            sl_trigger_price=PRICE_90_000,
+            tp_price=PRICE_90_500,
             entry_order_type=OrderType.LIMIT_IF_TOUCHED,
             contingency_type=contingency_type,
         )